@@ -1,9 +1,51 @@
 import os
-import json
+import asyncio
 import logging
-from web3 import Web3
+import orjson
+from cachetools import TTLCache
+from eth_abi import encode as abi_encode
+from eth_utils import function_signature_to_4byte_selector
+from web3 import AsyncWeb3, Web3
 from dotenv import load_dotenv
-from typing import Dict, Any
+from typing import Any, Dict, List
+
+# Handlers and levels come from AppConfig's logging setup; configuring
+# the root logger in constructors duplicated handlers per instance
+logger = logging.getLogger(__name__)
+
+# Pin eth-keys to the libsecp256k1 backend when coincurve is installed:
+# native signing is orders of magnitude faster than the pure-Python
+# fallback, which matters under high-frequency trade recording.
+try:
+    import coincurve  # noqa: F401
+    os.environ.setdefault(
+        'ECC_BACKEND_CLASS', 'eth_keys.backends.CoinCurveECCBackend'
+    )
+except ImportError:
+    logger.warning(
+        "coincurve not installed; transaction signing falls back to the "
+        "slow pure-Python secp256k1 backend"
+    )
+
+# One Web3 connection per provider URL, shared across verifier instances
+# so each instance reuses the underlying HTTP session.
+_web3_instances = {}
+
+def _get_web3(provider_url: str) -> Web3:
+    """
+    Return a process-wide Web3 instance for the given provider URL
+
+    Args:
+        provider_url (str): HTTP provider endpoint
+
+    Returns:
+        Shared Web3 instance
+    """
+    w3 = _web3_instances.get(provider_url)
+    if w3 is None:
+        w3 = Web3(Web3.HTTPProvider(provider_url))
+        _web3_instances[provider_url] = w3
+    return w3
 
 class BlockchainVerifier:
     def __init__(self):
@@ -11,18 +53,89 @@ class BlockchainVerifier:
         Initialize Blockchain Verification System
         """
         load_dotenv()
-        
-        # Logging setup
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
-        
+
         # Web3 Connection
         self.provider_url = os.getenv('BLOCKCHAIN_PROVIDER_URL', 'https://mainnet.infura.io/v3/YOUR_PROJECT_ID')
-        self.w3 = Web3(Web3.HTTPProvider(self.provider_url))
-        
+        self.w3 = _get_web3(self.provider_url)
+
         # Smart Contract Configuration
         self.contract_address = os.getenv('TRADE_VERIFICATION_CONTRACT')
         self.contract_abi = self.load_contract_abi()
+
+        # Sending account, shared by the sync and async connections;
+        # default_account set on one connection is not visible to the other
+        self.account_address = os.getenv('BLOCKCHAIN_ACCOUNT_ADDRESS')
+
+        # Build the contract proxy once; constructing it per call re-parses
+        # the ABI and rebuilds every function wrapper.
+        self.contract = self.w3.eth.contract(
+            address=self.contract_address,
+            abi=self.contract_abi
+        )
+
+        # Gas price is an RPC round-trip; a short TTL is plenty accurate
+        self._gas_price_cache = TTLCache(maxsize=1, ttl=15)
+
+        # Precomputed calldata pieces for recordTrade: encoding through
+        # the ContractFunction proxy re-derives the selector and walks
+        # the ABI types on every call
+        self._record_selector = function_signature_to_4byte_selector(
+            'recordTrade(string,uint256,uint256,uint256)'
+        )
+        self._record_types = ['string', 'uint256', 'uint256', 'uint256']
+
+        # Async connection for batched writes, created on first use
+        self._async_w3 = None
+
+    def _get_async_web3(self) -> AsyncWeb3:
+        """
+        Return the lazily created async Web3 connection
+
+        Returns:
+            AsyncWeb3 instance
+        """
+        if self._async_w3 is None:
+            self._async_w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(self.provider_url))
+        return self._async_w3
+
+    def _from_address(self) -> str:
+        """
+        Account trades are sent from, for both connections
+
+        Returns:
+            Account address, or None when unconfigured
+        """
+        return self.account_address or self.w3.eth.default_account
+
+    def _gas_price(self) -> int:
+        """
+        Current gas price, cached for a few blocks
+
+        Returns:
+            Gas price in wei
+        """
+        price = self._gas_price_cache.get('gas_price')
+        if price is None:
+            price = self.w3.eth.gas_price
+            self._gas_price_cache['gas_price'] = price
+        return price
+
+    def _record_trade_calldata(self, trade_details: Dict[str, Any]) -> bytes:
+        """
+        ABI-encode a recordTrade call using the cached selector
+
+        Args:
+            trade_details (dict): Trade information to record
+
+        Returns:
+            Raw calldata bytes
+        """
+        return self._record_selector + abi_encode(self._record_types, [
+            trade_details['symbol'],
+            trade_details['amount'],
+            trade_details['price'],
+            trade_details['timestamp']
+        ])
     
     def load_contract_abi(self) -> list:
         """
@@ -32,10 +145,12 @@ class BlockchainVerifier:
             Contract ABI as list
         """
         try:
-            with open('blockchain/smart_contracts/TradeVerification_abi.json', 'r') as f:
-                return json.load(f)
+            # orjson parses the raw bytes directly, skipping the
+            # Python-level decode stdlib json would do
+            with open('blockchain/smart_contracts/TradeVerification_abi.json', 'rb') as f:
+                return orjson.loads(f.read())
         except Exception as e:
-            self.logger.error(f"ABI loading failed: {e}")
+            logger.error("ABI loading failed: %s", e)
             return []
     
     def record_trade(self, trade_details: Dict[str, Any]) -> bool:
@@ -49,23 +164,18 @@ class BlockchainVerifier:
             bool: Success status
         """
         try:
-            # Initialize contract
-            contract = self.w3.eth.contract(
-                address=self.contract_address, 
-                abi=self.contract_abi
-            )
-            
-            # Prepare transaction
-            transaction = contract.functions.recordTrade(
-                trade_details['symbol'],
-                trade_details['amount'],
-                trade_details['price'],
-                trade_details['timestamp']
-            ).build_transaction({
-                'from': self.w3.eth.default_account,
+            sender = self._from_address()
+
+            # Prepare transaction from the pre-encoded calldata, skipping
+            # the ContractFunction proxy entirely
+            transaction = {
+                'from': sender,
+                'to': self.contract_address,
                 'gas': 100000,
-                'gasPrice': self.w3.eth.gas_price
-            })
+                'gasPrice': self._gas_price(),
+                'nonce': self.w3.eth.get_transaction_count(sender),
+                'data': self._record_trade_calldata(trade_details)
+            }
             
             # Sign and send transaction
             signed_txn = self.w3.eth.account.sign_transaction(
@@ -76,13 +186,86 @@ class BlockchainVerifier:
             tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
             tx_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
             
-            self.logger.info(f"Trade recorded on blockchain: {tx_hash.hex()}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Trade recorded on blockchain: %s", tx_hash.hex())
             return tx_receipt['status'] == 1
         
         except Exception as e:
-            self.logger.error(f"Blockchain recording failed: {e}")
+            logger.error("Blockchain recording failed: %s", e)
             return False
-    
+
+    async def record_trade_async(self, trade_details: Dict[str, Any],
+                                 nonce: int = None) -> bool:
+        """
+        Record trade details on blockchain without blocking the event loop
+
+        Args:
+            trade_details (dict): Trade information to record
+            nonce (int, optional): Explicit transaction nonce, needed when
+                several trades are submitted concurrently
+
+        Returns:
+            bool: Success status
+        """
+        try:
+            w3 = self._get_async_web3()
+            sender = self._from_address()
+
+            if nonce is None:
+                nonce = await w3.eth.get_transaction_count(sender)
+
+            transaction = {
+                'from': sender,
+                'to': self.contract_address,
+                'gas': 100000,
+                'gasPrice': await w3.eth.gas_price,
+                'nonce': nonce,
+                'data': self._record_trade_calldata(trade_details)
+            }
+
+            # Signing is local and synchronous; only the RPC calls await
+            signed_txn = w3.eth.account.sign_transaction(
+                transaction,
+                private_key=os.getenv('BLOCKCHAIN_PRIVATE_KEY')
+            )
+
+            tx_hash = await w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+            tx_receipt = await w3.eth.wait_for_transaction_receipt(tx_hash)
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Trade recorded on blockchain: %s", tx_hash.hex())
+            return tx_receipt['status'] == 1
+
+        except Exception as e:
+            logger.error("Blockchain recording failed: %s", e)
+            return False
+
+    async def record_trades(self, trades: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Record several trades concurrently
+
+        Each receipt wait spans at least one block, so submitting N trades
+        concurrently costs roughly the slowest confirmation rather than the
+        sum. Nonces are assigned up front so the transactions do not collide.
+
+        Args:
+            trades (list): Trade detail dictionaries
+
+        Returns:
+            List of per-trade success flags
+        """
+        try:
+            w3 = self._get_async_web3()
+            base_nonce = await w3.eth.get_transaction_count(self._from_address())
+        except Exception as e:
+            logger.error("Batch nonce lookup failed: %s", e)
+            return [False] * len(trades)
+
+        return await asyncio.gather(*(
+            self.record_trade_async(trade, nonce=base_nonce + i)
+            for i, trade in enumerate(trades)
+        ))
+
     def verify_trade(self, trade_hash: str) -> Dict[str, Any]:
         """
         Verify trade details from blockchain
@@ -94,12 +277,7 @@ class BlockchainVerifier:
             Trade verification details
         """
         try:
-            contract = self.w3.eth.contract(
-                address=self.contract_address, 
-                abi=self.contract_abi
-            )
-            
-            trade_details = contract.functions.getTrade(trade_hash).call()
+            trade_details = self.contract.functions.getTrade(trade_hash).call()
             return {
                 'symbol': trade_details[0],
                 'amount': trade_details[1],
@@ -107,7 +285,7 @@ class BlockchainVerifier:
                 'timestamp': trade_details[3]
             }
         except Exception as e:
-            self.logger.error(f"Trade verification failed: {e}")
+            logger.error("Trade verification failed: %s", e)
             return {}
 
 # Usage example
@@ -1,4 +1,4 @@
 # backend/config/__init__.py
-from .app_config import AppConfig, config
+from .app_config import AppConfig, get_app_config
 
-__all__ = ['AppConfig', 'config']
\ No newline at end of file
+__all__ = ['AppConfig', 'get_app_config']
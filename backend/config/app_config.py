@@ -1,148 +1,187 @@
 # backend/config/app_config.py
 import os
 import logging
-from dotenv import load_dotenv
-from typing import Dict, Any
+from dataclasses import dataclass
+from dotenv import dotenv_values
+from typing import Any, List
 
+# Parsed once per process; load_dotenv re-parses the file on every call.
+_env_file_values = None
+
+def _getenv(key: str, default: Any = None) -> Any:
+    """
+    Read a setting from the process environment, falling back to the
+    memoized .env file
+
+    Args:
+        key (str): Environment variable name
+        default (Any, optional): Default value if key not found
+
+    Returns:
+        Setting value
+    """
+    global _env_file_values
+    if _env_file_values is None:
+        _env_file_values = dotenv_values('.env')
+
+    value = os.environ.get(key)
+    if value is None:
+        value = _env_file_values.get(key)
+    return value if value is not None else default
+
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """
     Centralized configuration management for AITradeGuard
+
+    Settings live in typed slots, so reads are single attribute loads
+    instead of dict lookups through an instance __dict__.
     """
-    _instance = None
+    # Application Settings
+    environment: str
+    debug_mode: bool
 
-    def __new__(cls):
-        """
-        Singleton pattern to ensure only one configuration instance
-        """
-        if not cls._instance:
-            cls._instance = super(AppConfig, cls).__new__(cls)
-        return cls._instance
+    # Trading Configuration
+    trading_symbols: List[str]
+    max_trade_amount: float
 
-    def __init__(self):
-        """
-        Initialize application configuration
-        """
-        # Prevent re-initialization
-        if not hasattr(self, 'initialized'):
-            # Load environment variables
-            load_dotenv()
-            
-            # Configure logging
-            self._setup_logging()
-            
-            # Load configuration
-            self.config = self._load_config()
-            
-            # Mark as initialized
-            self.initialized = True
-    
-    def _setup_logging(self):
-        """
-        Configure application logging
-        """
-        log_level = logging.INFO if self.get_config('ENVIRONMENT') != 'production' else logging.ERROR
-        
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            filename='logs/aitradeguard.log',
-            filemode='a'
-        )
-        
-        # Console handler for development
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        logging.getLogger('').addHandler(console_handler)
-    
-    def _load_config(self) -> Dict[str, Any]:
+    # API Credentials
+    bybit_api_key: str
+    bybit_api_secret: str
+
+    # Blockchain Configuration
+    blockchain_provider: str
+    trade_contract_address: str
+
+    # AI Model Configuration
+    model_training_frequency: int
+    sentiment_symbols: List[str]
+
+    # Security Settings
+    max_consecutive_trades: int
+    risk_threshold: float
+
+    # Precomputed at construction to spare the repeated string compare
+    production: bool
+
+    @classmethod
+    def from_env(cls) -> 'AppConfig':
         """
-        Load configuration from environment variables
-        
+        Build configuration from environment variables
+
         Returns:
-            Dictionary of configuration settings
+            Populated AppConfig instance
         """
-        return {
-            # Application Settings
-            'ENVIRONMENT': os.getenv('APP_ENV', 'development'),
-            'DEBUG_MODE': os.getenv('DEBUG', 'False').lower() == 'true',
-            
-            # Trading Configuration
-            'TRADING_SYMBOLS': os.getenv('TRADING_SYMBOLS', 'BTC/USDT,ETH/USDT').split(','),
-            'MAX_TRADE_AMOUNT': float(os.getenv('MAX_TRADE_AMOUNT', 100)),
-            
-            # API Credentials
-            'BYBIT_API_KEY': os.getenv('BYBIT_API_KEY'),
-            'BYBIT_API_SECRET': os.getenv('BYBIT_API_SECRET'),
-            
-            # Blockchain Configuration
-            'BLOCKCHAIN_PROVIDER': os.getenv('BLOCKCHAIN_PROVIDER_URL'),
-            'TRADE_CONTRACT_ADDRESS': os.getenv('TRADE_VERIFICATION_CONTRACT'),
-            
-            # AI Model Configuration
-            'MODEL_TRAINING_FREQUENCY': int(os.getenv('MODEL_TRAIN_FREQ', 7)),
-            'SENTIMENT_SYMBOLS': os.getenv('SENTIMENT_SYMBOLS', 'BTC,ETH').split(','),
-            
-            # Security Settings
-            'MAX_CONSECUTIVE_TRADES': int(os.getenv('MAX_CONSECUTIVE_TRADES', 5)),
-            'RISK_THRESHOLD': float(os.getenv('RISK_THRESHOLD', 0.5))
-        }
-    
+        environment = _getenv('APP_ENV', 'development')
+
+        return cls(
+            environment=environment,
+            debug_mode=_getenv('DEBUG', 'False').lower() == 'true',
+            trading_symbols=_getenv('TRADING_SYMBOLS', 'BTC/USDT,ETH/USDT').split(','),
+            max_trade_amount=float(_getenv('MAX_TRADE_AMOUNT', 100)),
+            bybit_api_key=_getenv('BYBIT_API_KEY'),
+            bybit_api_secret=_getenv('BYBIT_API_SECRET'),
+            blockchain_provider=_getenv('BLOCKCHAIN_PROVIDER_URL'),
+            trade_contract_address=_getenv('TRADE_VERIFICATION_CONTRACT'),
+            model_training_frequency=int(_getenv('MODEL_TRAIN_FREQ', 7)),
+            sentiment_symbols=_getenv('SENTIMENT_SYMBOLS', 'BTC,ETH').split(','),
+            max_consecutive_trades=int(_getenv('MAX_CONSECUTIVE_TRADES', 5)),
+            risk_threshold=float(_getenv('RISK_THRESHOLD', 0.5)),
+            production=environment == 'production'
+        )
+
     def get_config(self, key: str, default: Any = None) -> Any:
         """
         Retrieve a specific configuration value
-        
+
+        Compatibility shim over attribute access; legacy upper-case keys
+        map to the corresponding field name.
+
         Args:
             key (str): Configuration key
             default (Any, optional): Default value if key not found
-        
+
         Returns:
             Configuration value
         """
-        return self.config.get(key, default)
-    
+        return getattr(self, key.lower(), default)
+
     def is_production(self) -> bool:
         """
         Check if application is running in production environment
-        
+
         Returns:
             Boolean indicating production status
         """
-        return self.get_config('ENVIRONMENT') == 'production'
-    
+        return self.production
+
     def validate_config(self) -> bool:
         """
         Validate critical configuration settings
-        
+
         Returns:
             Boolean indicating configuration validity
         """
-        critical_keys = [
-            'BYBIT_API_KEY', 
-            'BYBIT_API_SECRET', 
-            'BLOCKCHAIN_PROVIDER'
+        critical_fields = [
+            'bybit_api_key',
+            'bybit_api_secret',
+            'blockchain_provider'
         ]
-        
-        for key in critical_keys:
-            if not self.get_config(key):
-                logging.error(f"Missing critical configuration: {key}")
+
+        for name in critical_fields:
+            if not getattr(self, name):
+                logging.error(f"Missing critical configuration: {name}")
                 return False
-        
+
         return True
 
-# Create global configuration instance
-config = AppConfig()
+def _setup_logging(production: bool):
+    """
+    Configure application logging
+    """
+    log_level = logging.ERROR if production else logging.INFO
+
+    logging.basicConfig(
+        level=log_level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        filename='logs/aitradeguard.log',
+        filemode='a'
+    )
+
+    # Console handler for development
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    logging.getLogger('').addHandler(console_handler)
+
+# Global configuration instance, created on first use instead of at
+# import time
+_config_instance = None
+
+def get_app_config() -> AppConfig:
+    """
+    Return the lazily created global configuration instance
+
+    Returns:
+        Shared AppConfig instance
+    """
+    global _config_instance
+    if _config_instance is None:
+        _config_instance = AppConfig.from_env()
+        _setup_logging(_config_instance.production)
+    return _config_instance
 
 # Example usage
 def main():
+    config = get_app_config()
+
     # Validate configuration
     if config.validate_config():
         print("Configuration is valid!")
-        
+
         # Access configuration values
-        trading_symbols = config.get_config('TRADING_SYMBOLS')
-        print(f"Trading Symbols: {trading_symbols}")
+        print(f"Trading Symbols: {config.trading_symbols}")
     else:
         print("Invalid configuration. Please check your .env file.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,101 +1,255 @@
 import os
-import ccxt
+import asyncio
+import functools
 import logging
-from typing import Dict, Any
+import time
+import ccxt.async_support as ccxt
+from typing import Any, Dict, List
 from dotenv import load_dotenv
 
+# Handlers and levels come from AppConfig's logging setup; configuring
+# the root logger in constructors duplicated handlers per instance
+logger = logging.getLogger(__name__)
+
+try:
+    import ccxt.pro as ccxtpro
+except ImportError:
+    ccxtpro = None
+
+@functools.lru_cache(maxsize=4)
+def _get_exchange(api_key: str, api_secret: str) -> ccxt.bybit:
+    """
+    Return a process-wide ccxt exchange for the given credentials
+
+    A fresh exchange per BybitTrader means a fresh connection pool and a
+    TLS handshake per request; sharing one instance keeps the underlying
+    aiohttp session alive so API calls reuse warm connections.
+
+    Args:
+        api_key (str): Bybit API Key
+        api_secret (str): Bybit API Secret
+
+    Returns:
+        Shared ccxt.bybit instance
+    """
+    return ccxt.bybit({
+        'apiKey': api_key,
+        'secret': api_secret,
+        'enableRateLimit': True,
+        'options': {
+            'defaultType': 'future'  # Futures trading
+        }
+    })
+
+@functools.lru_cache(maxsize=4)
+def get_trader(api_key: str = None, api_secret: str = None) -> 'BybitTrader':
+    """
+    Cached factory returning one BybitTrader per credential pair
+
+    Args:
+        api_key (str): Bybit API Key
+        api_secret (str): Bybit API Secret
+
+    Returns:
+        Shared BybitTrader instance
+    """
+    return BybitTrader(api_key, api_secret)
+
 class BybitTrader:
     def __init__(self, api_key: str = None, api_secret: str = None):
         """
         Initialize Bybit trading connector
-        
+
+        All exchange calls are coroutines; run them on a single event loop
+        so concurrent requests share one connection pool instead of
+        serializing network round-trips.
+
         Args:
             api_key (str): Bybit API Key
             api_secret (str): Bybit API Secret
         """
         load_dotenv()
-        
-        # Logging configuration
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
-        
+
         # API Credentials
         self.api_key = api_key or os.getenv('BYBIT_API_KEY')
         self.api_secret = api_secret or os.getenv('BYBIT_API_SECRET')
-        
-        # Initialize Bybit exchange
-        self.exchange = ccxt.bybit({
-            'apiKey': self.api_key,
-            'secret': self.api_secret,
-            'enableRateLimit': True,
-            'options': {
-                'defaultType': 'future'  # Futures trading
-            }
-        })
-    
-    def get_account_balance(self) -> Dict[str, float]:
+
+        # Initialize Bybit exchange (shared per credential pair)
+        self.exchange = _get_exchange(self.api_key, self.api_secret)
+
+        # WebSocket price feed state: last prices land in a dict updated
+        # by a background task, so reads are O(1) lookups instead of REST
+        # round-trips
+        self._ws_exchange = None
+        self._stream_task = None
+        self._last_prices = {}
+        self._price_times = {}
+
+    async def get_account_balance(self) -> Dict[str, float]:
         """
         Retrieve account balance
-        
+
         Returns:
             Dict containing balance information
         """
         try:
-            balance = self.exchange.fetch_balance()
+            balance = await self.exchange.fetch_balance()
             return {
                 'total': balance['total']['USDT'],
                 'free': balance['free']['USDT'],
                 'used': balance['used']['USDT']
             }
         except Exception as e:
-            self.logger.error(f"Balance retrieval failed: {e}")
+            logger.error("Balance retrieval failed: %s", e)
             return {}
-    
-    def create_market_order(self, symbol: str, side: str, amount: float) -> Dict[str, Any]:
+
+    async def create_market_order(self, symbol: str, side: str, amount: float) -> Dict[str, Any]:
         """
         Create a market order
-        
+
         Args:
             symbol (str): Trading pair (e.g., 'BTC/USDT')
             side (str): 'buy' or 'sell'
             amount (float): Order quantity
-        
+
         Returns:
             Dict containing order details
         """
         try:
-            order = self.exchange.create_market_order(symbol, side, amount)
-            self.logger.info(f"Order created: {order}")
+            order = await self.exchange.create_market_order(symbol, side, amount)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Order created: %s", order)
             return order
         except Exception as e:
-            self.logger.error(f"Order creation failed: {e}")
+            logger.error("Order creation failed: %s", e)
             return {}
-    
-    def get_current_price(self, symbol: str) -> float:
+
+    def start_price_stream(self, symbols: List[str]) -> bool:
+        """
+        Subscribe to Bybit's WebSocket ticker stream for the given symbols
+
+        Args:
+            symbols (list): Trading pairs to stream
+
+        Returns:
+            bool: True if the stream task was started
+        """
+        if ccxtpro is None:
+            logger.warning(
+                "ccxt.pro not available; prices fall back to REST polling")
+            return False
+        if self._stream_task is None or self._stream_task.done():
+            if self._ws_exchange is None:
+                self._ws_exchange = ccxtpro.bybit({
+                    'apiKey': self.api_key,
+                    'secret': self.api_secret,
+                    'options': {
+                        'defaultType': 'future'
+                    }
+                })
+            self._stream_task = asyncio.get_running_loop().create_task(
+                self._stream_tickers(list(symbols)))
+        return True
+
+    async def _stream_tickers(self, symbols: List[str]):
+        """
+        Background task keeping the last-price dict current
+
+        Args:
+            symbols (list): Trading pairs to watch
+        """
+        while True:
+            try:
+                tickers = await self._ws_exchange.watch_tickers(symbols)
+                now = time.monotonic()
+                for symbol, ticker in tickers.items():
+                    self._last_prices[symbol] = ticker['last']
+                    self._price_times[symbol] = now
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Ticker stream error: %s", e)
+                await asyncio.sleep(1)
+
+    def price_age_ms(self, symbol: str) -> float:
+        """
+        Age of the streamed price for a symbol
+
+        Args:
+            symbol (str): Trading pair
+
+        Returns:
+            Milliseconds since the last ticker update, or inf if unseen
+        """
+        last_update = self._price_times.get(symbol)
+        if last_update is None:
+            return float('inf')
+        return (time.monotonic() - last_update) * 1000.0
+
+    async def get_current_price(self, symbol: str) -> float:
         """
         Get current market price
-        
+
+        Served from the WebSocket feed when one is running; falls back to
+        a REST fetch for symbols the stream has not seen yet.
+
         Args:
             symbol (str): Trading pair
-        
+
         Returns:
             Current market price
         """
+        price = self._last_prices.get(symbol)
+        if price is not None:
+            return price
+
         try:
-            ticker = self.exchange.fetch_ticker(symbol)
+            ticker = await self.exchange.fetch_ticker(symbol)
             return ticker['last']
         except Exception as e:
-            self.logger.error(f"Price retrieval failed: {e}")
+            logger.error("Price retrieval failed: %s", e)
             return 0.0
 
+    async def get_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Get current market prices for several symbols in one burst
+
+        Args:
+            symbols (list): Trading pairs
+
+        Returns:
+            Dict mapping symbol to last price
+        """
+        try:
+            tickers = await self.exchange.fetch_tickers(symbols)
+            return {symbol: tickers[symbol]['last'] for symbol in symbols}
+        except Exception as e:
+            logger.error("Price retrieval failed: %s", e)
+            return {}
+
+    async def close(self):
+        """
+        Release the exchange's network resources
+        """
+        if self._stream_task is not None:
+            self._stream_task.cancel()
+            self._stream_task = None
+        if self._ws_exchange is not None:
+            await self._ws_exchange.close()
+            self._ws_exchange = None
+        await self.exchange.close()
+
 # Usage example
-def main():
-    trader = BybitTrader()
-    balance = trader.get_account_balance()
-    print(f"Account Balance: {balance}")
-    
-    btc_price = trader.get_current_price('BTC/USDT')
-    print(f"Current BTC Price: ${btc_price}")
+async def main():
+    trader = get_trader()
+    try:
+        balance = await trader.get_account_balance()
+        print(f"Account Balance: {balance}")
+
+        btc_price = await trader.get_current_price('BTC/USDT')
+        print(f"Current BTC Price: ${btc_price}")
+    finally:
+        await trader.close()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())